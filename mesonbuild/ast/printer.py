@@ -14,7 +14,9 @@ import typing as T
 
 class AstPrinter(AstVisitor):
     def __init__(self, indent: int = 2, arg_newline_cutoff: int = 5, update_ast_line_nos: bool = False):
-        self.result = ''
+        # Output is accumulated in a list and only joined on demand, since
+        # repeated ``str +=`` on an attribute is quadratic.
+        self._parts: T.List[str] = []
         self.indent = indent
         self.arg_newline_cutoff = arg_newline_cutoff
         self.ci = ''
@@ -22,23 +24,43 @@ class AstPrinter(AstVisitor):
         self.last_level = 0
         self.curr_line = 1 if update_ast_line_nos else None
 
+    @property
+    def result(self) -> str:
+        if len(self._parts) > 1:
+            self._parts = [''.join(self._parts)]
+        return self._parts[0] if self._parts else ''
+
+    @result.setter
+    def result(self, value: str) -> None:
+        self._parts = [value] if value else []
+
     def post_process(self) -> None:
         self.result = re.sub(r'\s+\n', '\n', self.result)
 
+    def _replace_suffix(self, suffix: str, replacement: str) -> None:
+        tail = ''
+        while self._parts and len(tail) < len(suffix):
+            tail = self._parts.pop() + tail
+        if tail.endswith(suffix):
+            tail = tail[:-len(suffix)] + replacement
+        if tail:
+            self._parts.append(tail)
+
     def append(self, data: str, node: mparser.BaseNode) -> None:
         self.last_level = node.level
-        if self.is_newline:
-            self.result += ' ' * (node.level * self.indent)
-        self.result += data
+        if self.is_newline and node.level * self.indent:
+            self._parts.append(' ' * (node.level * self.indent))
+        if data:
+            self._parts.append(data)
         self.is_newline = False
 
     def append_padded(self, data: str, node: mparser.BaseNode) -> None:
-        if self.result and self.result[-1] not in [' ', '\n']:
+        if self._parts and self._parts[-1][-1] not in [' ', '\n']:
             data = ' ' + data
         self.append(data + ' ', node)
 
     def newline(self) -> None:
-        self.result += '\n'
+        self._parts.append('\n')
         self.is_newline = True
         if self.curr_line is not None:
             self.curr_line += 1
@@ -218,9 +240,9 @@ class AstPrinter(AstVisitor):
             if break_args:
                 self.newline()
         if break_args:
-            self.result = re.sub(r', \n$', '\n', self.result)
+            self._replace_suffix(', \n', '\n')
         else:
-            self.result = re.sub(r', $', '', self.result)
+            self._replace_suffix(', ', '')
 
 class RawPrinter(FullAstVisitor):
 
@@ -304,12 +304,11 @@ class Build:
         return custom_targets
 
     def copy(self) -> Build:
-        other = Build(self.environment)
-        for k, v in self.__dict__.items():
-            if isinstance(v, (list, dict, set, OrderedDict)):
-                other.__dict__[k] = v.copy()
-            else:
-                other.__dict__[k] = v
+        # Every attribute gets replaced below, so skip __init__ and the
+        # containers it would create only to throw them away.
+        other = Build.__new__(Build)
+        other.__dict__.update({k: v.copy() if isinstance(v, (list, dict, set)) else v
+                               for k, v in self.__dict__.items()})
         return other
 
     def merge(self, other: Build) -> None:
@@ -85,6 +85,8 @@ clib_langs = ('objcpp', 'cpp', 'objc', 'c', 'nasm', 'fortran')
 # used in build.py:process_compilers() and build.py:get_dynamic_linker()
 # This must be sorted, see sort_clink().
 clink_langs = ('d', 'cuda') + clib_langs
+# Precomputed sort keys for sort_clink()
+_CLINK_RANK = {lang: -i for i, lang in enumerate(clink_langs)}
 
 SUFFIX_TO_LANG = dict(itertools.chain(*(
     [(suffix, lang) for suffix in v] for lang, v in lang_suffixes.items())))
@@ -119,9 +121,7 @@ def sort_clink(lang: str) -> int:
     The purpose is to prefer C over C++ for files that can be compiled by
     both such as assembly, C, etc. Also applies to ObjC, ObjC++, etc.
     '''
-    if lang not in clink_langs:
-        return 1
-    return -clink_langs.index(lang)
+    return _CLINK_RANK.get(lang, 1)
 
 def is_header(fname: 'mesonlib.FileOrString') -> bool:
     if isinstance(fname, mesonlib.File):
@@ -11,7 +11,7 @@ from .. import mlog
 from .. import dependencies
 from .. import build
 from ..wrap import WrapMode
-from ..mesonlib import extract_as_list, stringlistify, version_compare_many, listify
+from ..mesonlib import MachineChoice, extract_as_list, stringlistify, version_compare_many, listify
 from ..options import OptionKey
 from ..dependencies import Dependency, DependencyException, NotFoundDependency
 from ..interpreterbase import (MesonInterpreterObject, FeatureNew,
@@ -20,6 +20,7 @@ from ..interpreterbase import (MesonInterpreterObject, FeatureNew,
 import typing as T
 if T.TYPE_CHECKING:
     from .interpreter import Interpreter
+    from ..dependencies.detect import TV_DepID
     from ..interpreterbase import TYPE_nkwargs, TYPE_nvar
     from .interpreterobjects import SubprojectHolder
 
@@ -44,6 +45,8 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
         self.names: T.List[str] = []
         self.forcefallback: bool = False
         self.nofallback: bool = False
+        self.identifiers: T.Dict[str, TV_DepID] = {}
+        self.for_machine = MachineChoice.HOST
         for name in names:
             if not name:
                 raise InterpreterException('dependency_fallbacks empty name \'\' is not allowed')
@@ -96,9 +99,8 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
         self._handle_featurenew_dependencies(name)
         dep = dependencies.find_external_dependency(name, self.environment, kwargs)
         if dep.found():
-            for_machine = self.interpreter.machine_from_native_kwarg(kwargs)
-            identifier = dependencies.get_dep_identifier(name, kwargs)
-            self.coredata.deps[for_machine].put(identifier, dep)
+            identifier = self._get_identifier(name, kwargs)
+            self.coredata.deps[self.for_machine].put(identifier, dep)
             return dep
         return None
 
@@ -210,13 +212,22 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
                  mlog.normal_cyan(found) if found else None)
         return var_dep
 
+    def _get_identifier(self, name: str, kwargs: TYPE_nkwargs) -> TV_DepID:
+        # During a lookup kwargs only change in keys that are not part of the
+        # identifier (e.g. 'required'), so compute it once per name.
+        identifier = self.identifiers.get(name)
+        if identifier is None:
+            identifier = dependencies.get_dep_identifier(name, kwargs)
+            self.identifiers[name] = identifier
+        return identifier
+
     def _get_cached_dep(self, name: str, kwargs: TYPE_nkwargs) -> T.Optional[Dependency]:
         # Unlike other methods, this one returns not-found dependency instead
         # of None in the case the dependency is cached as not-found, or if cached
         # version does not match. In that case we don't want to continue with
         # other candidates.
-        for_machine = self.interpreter.machine_from_native_kwarg(kwargs)
-        identifier = dependencies.get_dep_identifier(name, kwargs)
+        for_machine = self.for_machine
+        identifier = self._get_identifier(name, kwargs)
         wanted_vers = stringlistify(kwargs.get('version', []))
 
         override = self.build.dependency_overrides[for_machine].get(identifier)
@@ -268,10 +279,11 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
         return var_dep
 
     def _verify_fallback_consistency(self, cached_dep: Dependency) -> None:
-        subp_name = self.subproject_name
         varname = self.subproject_varname
-        subproject = self._get_subproject(subp_name)
-        if subproject and varname:
+        if not varname:
+            return
+        subproject = self._get_subproject(self.subproject_name)
+        if subproject:
             var_dep = self._get_subproject_variable(subproject, varname)
             if var_dep and cached_dep.found() and var_dep != cached_dep:
                 mlog.warning(f'Inconsistency: Subproject has overridden the dependency with another variable than {varname!r}')
@@ -316,6 +328,8 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
         return candidates
 
     def lookup(self, kwargs: TYPE_nkwargs, force_fallback: bool = False) -> Dependency:
+        self.identifiers.clear()
+        self.for_machine = self.interpreter.machine_from_native_kwarg(kwargs)
         mods = extract_as_list(kwargs, 'modules')
         if mods:
             self._display_name += ' (modules: {})'.format(', '.join(str(i) for i in mods))
@@ -366,11 +380,11 @@ class DependencyFallbacksHolder(MesonInterpreterObject):
             if dep and dep.found():
                 # Override this dependency to have consistent results in subsequent
                 # dependency lookups.
+                overrides = self.build.dependency_overrides[self.for_machine]
                 for name in self.names:
-                    for_machine = self.interpreter.machine_from_native_kwarg(kwargs)
-                    identifier = dependencies.get_dep_identifier(name, kwargs)
-                    if identifier not in self.build.dependency_overrides[for_machine]:
-                        self.build.dependency_overrides[for_machine][identifier] = \
+                    identifier = self._get_identifier(name, kwargs)
+                    if identifier not in overrides:
+                        overrides[identifier] = \
                             build.DependencyOverride(dep, self.interpreter.current_node, explicit=False)
                 return dep
             elif required and (dep or i == last):
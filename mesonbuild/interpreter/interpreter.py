@@ -15,7 +15,7 @@ from .. import options
 from .. import build
 from .. import compilers
 from .. import envconfig
-from ..wrap import wrap, WrapMode
+from ..wrap import WrapMode
 from .. import mesonlib
 from ..mesonlib import (EnvironmentVariables, ExecutableSerialisation, MesonBugException, MesonException, HoldableObject,
                         FileMode, MachineChoice, is_parent_path, listify,
@@ -98,6 +98,9 @@ from . import primitives as P_OBJ
 
 from pathlib import Path
 from enum import Enum
+import bisect
+import filecmp
+import itertools
 import os
 import shutil
 import uuid
@@ -116,6 +119,7 @@ if T.TYPE_CHECKING:
     from ..backend.backends import Backend
     from ..interpreterbase.baseobjects import InterpreterObject, TYPE_var, TYPE_kwargs
     from ..programs import OverrideProgram
+    from ..wrap import wrap
     from .type_checking import SourcesVarargsType
 
     # Input source types passed to Targets
@@ -142,16 +146,20 @@ def _project_version_validator(value: T.Union[T.List, str, mesonlib.File, None])
     return None
 
 class Summary:
+    __slots__ = ('project_name', 'project_version', 'sections')
+
     def __init__(self, project_name: str, project_version: str):
         self.project_name = project_name
         self.project_version = project_version
         self.sections = collections.defaultdict(dict)
-        self.max_key_len = 0
 
     def add_section(self, section: str, values: T.Dict[str, T.Any], bool_yn: bool,
                     list_sep: T.Optional[str], subproject: str) -> None:
+        if not values:
+            return
+        section_values = self.sections[section]
         for k, v in values.items():
-            if k in self.sections[section]:
+            if k in section_values:
                 raise InterpreterException(f'Summary section {section!r} already have key {k!r}')
             formatted_values = []
             for i in listify(v):
@@ -174,42 +182,44 @@ class Summary:
                 else:
                     m = 'Summary value in section {!r}, key {!r}, must be string, integer, boolean, dependency, disabler, or external program'
                     raise InterpreterException(m.format(section, k))
-            self.sections[section][k] = (formatted_values, list_sep)
-            self.max_key_len = max(self.max_key_len, len(k))
+            section_values[k] = (formatted_values, list_sep)
 
     def dump(self):
+        max_key_len = max((len(k) for s in self.sections.values() for k in s), default=0)
+        indent = max_key_len + 6
+        # The terminal is not going to be resized while we print
+        max_len = shutil.get_terminal_size().columns
         mlog.log(self.project_name, mlog.normal_cyan(self.project_version))
         for section, values in self.sections.items():
             mlog.log('')  # newline
             if section:
                 mlog.log(' ', mlog.bold(section))
-            for k, v in values.items():
-                v, list_sep = v
-                padding = self.max_key_len - len(k)
+            for k, (v, list_sep) in values.items():
+                padding = max_key_len - len(k)
                 end = ' ' if v else ''
                 mlog.log(' ' * 3, k + ' ' * padding + ':', end=end)
-                indent = self.max_key_len + 6
-                self.dump_value(v, list_sep, indent)
+                self.dump_value(v, list_sep, indent, max_len)
         mlog.log('')  # newline
 
-    def dump_value(self, arr, list_sep, indent):
+    def dump_value(self, arr, list_sep, indent, max_len):
         lines_sep = '\n' + ' ' * indent
         if list_sep is None:
             mlog.log(*arr, sep=lines_sep, display_timestamp=False)
             return
-        max_len = shutil.get_terminal_size().columns
-        line = []
-        line_len = indent
         lines_sep = list_sep.rstrip() + lines_sep
-        for v in arr:
-            v_len = len(v) + len(list_sep)
-            if line and line_len + v_len > max_len:
-                mlog.log(*line, sep=list_sep, end=lines_sep)
-                line_len = indent
-                line = []
-            line.append(v)
-            line_len += v_len
-        mlog.log(*line, sep=list_sep, display_timestamp=False)
+        # Running total of the printed width, so that each line break can be
+        # found with a bisection instead of summing up values one by one.
+        # Every line holds at least one value, even if it is too wide.
+        sep_len = len(list_sep)
+        widths = [0, *itertools.accumulate(len(v) + sep_len for v in arr)]
+        start = 0
+        while True:
+            end = max(bisect.bisect_right(widths, widths[start] + max_len - indent) - 1, start + 1)
+            if end >= len(arr):
+                break
+            mlog.log(*arr[start:end], sep=list_sep, end=lines_sep)
+            start = end
+        mlog.log(*arr[start:], sep=list_sep, display_timestamp=False)
 
 known_library_kwargs = (
     build.known_shlib_kwargs |
@@ -235,7 +245,7 @@ class InterpreterRuleRelaxation(Enum):
 
     ALLOW_BUILD_DIR_FILE_REFERENCES = 1
 
-permitted_dependency_kwargs = {
+permitted_dependency_kwargs = frozenset({
     'allow_fallback',
     'cmake_args',
     'cmake_module_path',
@@ -255,8 +265,36 @@ permitted_dependency_kwargs = {
     'required',
     'static',
     'version',
+})
+
+# Matches an empty name, a leading period, or a ".." anywhere, in that order
+# of precedence
+_INVALID_SUBPROJECT_NAME_RE = re.compile(r'^$|^\.|\.\.')
+
+# Indexed input substitutions allowed in custom_target outputs since 1.5.0
+_INDEXED_OUTPUT_SUBST_RES = (re.compile(r'@PLAINNAME[0-9]+@'), re.compile(r'@BASENAME[0-9]+@'))
+
+# Compiler arguments that have a built-in option, mapped to that option
+# -Wpedantic is deliberately not included, since some people want to use it but not use -Wextra
+# see e.g.
+# https://github.com/mesonbuild/meson/issues/3275#issuecomment-641354956
+# https://github.com/mesonbuild/meson/issues/3742
+_BUILTIN_ARG_OPTIONS: T.Dict[str, str] = {
+    **dict.fromkeys(['/W1', '/W2', '/W3', '/W4', '/Wall', '-Wall', '-Wextra'], 'warning_level option'),
+    **dict.fromkeys(['-O0', '-O2', '-O3', '-Os', '-Oz', '/O1', '/O2', '/Os'], 'optimization level'),
+    '-Werror': 'werror option',
+    '-g': 'debug option',
+    '-fsanitize': 'option for sanitizers',
+    '/fsanitize': 'option for sanitizers',
 }
 
+# Enum member lookups are slow, these are used for every native: kwarg
+_BUILD_MACHINE = MachineChoice.BUILD
+_HOST_MACHINE = MachineChoice.HOST
+
+# A test setup name, optionally prefixed with a project name
+_SETUP_NAME_RE = re.compile(r'([_a-zA-Z][_0-9a-zA-Z]*:)?[_a-zA-Z][_0-9a-zA-Z]*')
+
 implicit_check_false_warning = """You should add the boolean check kwarg to the run_command call.
          It currently defaults to false,
          but it will default to true in meson 2.0.
@@ -278,6 +316,9 @@ class Interpreter(InterpreterBase, HoldableObject):
         super().__init__(_build.environment.get_source_dir(), subdir, subproject, subproject_dir, _build.environment)
         self.active_projectname = ''
         self.build = _build
+        # Used to relativize build definition files, see add_build_def_file()
+        self.source_dir_path = Path(self.environment.get_source_dir())
+        self.build_dir_path = Path(self.environment.get_build_dir())
         self.backend = backend
         self.summary: T.Dict[str, 'Summary'] = {}
         self.modules: T.Dict[str, NewExtensionModule] = {}
@@ -289,11 +330,18 @@ class Interpreter(InterpreterBase, HoldableObject):
         self.sanity_check_ast()
         self.builtin.update({'meson': MesonMain(self.build, self)})
         self.validated_cache: T.Set[str] = set()
+        # Include directories that are known to exist, directories are never
+        # removed during configuration so only positive results are kept
+        self.existing_incdirs: T.Set[str] = set()
         self.project_args_frozen = False
         self.global_args_frozen = False  # implies self.project_args_frozen
         self.subprojects: T.Dict[str, SubprojectHolder] = {}
         self.subproject_stack: T.List[str] = []
         self.configure_file_outputs: T.Dict[str, int] = {}
+        self.run_command_programs: T.Dict[T.Tuple[str, T.Optional[str]], ExternalProgram] = {}
+        self.introspect_command: T.Optional[T.List[str]] = None
+        self.system_programs: T.Dict[T.Tuple[str, T.Tuple[str, ...]], ExternalProgram] = {}
+        self.python3_program: T.Optional[ExternalProgram] = None
         # Passed from the outside, only used in subprojects.
         if default_project_options:
             self.default_project_options = default_project_options if isinstance(default_project_options, str) else default_project_options.copy()
@@ -330,67 +378,72 @@ class Interpreter(InterpreterBase, HoldableObject):
         self.builtin['target_machine'] = \
             OBJ.MachineHolder(self.build.environment.machines.target, self)
 
+    # Mapping of meson function names to the Interpreter methods implementing
+    # them. This is built once with the class and bound per instance.
+    FUNCTIONS: T.ClassVar[T.Tuple[T.Tuple[str, str], ...]] = (
+        ('add_global_arguments', 'func_add_global_arguments'),
+        ('add_global_link_arguments', 'func_add_global_link_arguments'),
+        ('add_languages', 'func_add_languages'),
+        ('add_project_arguments', 'func_add_project_arguments'),
+        ('add_project_dependencies', 'func_add_project_dependencies'),
+        ('add_project_link_arguments', 'func_add_project_link_arguments'),
+        ('add_test_setup', 'func_add_test_setup'),
+        ('alias_target', 'func_alias_target'),
+        ('assert', 'func_assert'),
+        ('benchmark', 'func_benchmark'),
+        ('both_libraries', 'func_both_lib'),
+        ('build_target', 'func_build_target'),
+        ('configuration_data', 'func_configuration_data'),
+        ('configure_file', 'func_configure_file'),
+        ('custom_target', 'func_custom_target'),
+        ('debug', 'func_debug'),
+        ('declare_dependency', 'func_declare_dependency'),
+        ('dependency', 'func_dependency'),
+        ('disabler', 'func_disabler'),
+        ('environment', 'func_environment'),
+        ('error', 'func_error'),
+        ('executable', 'func_executable'),
+        ('files', 'func_files'),
+        ('find_program', 'func_find_program'),
+        ('generator', 'func_generator'),
+        ('get_option', 'func_get_option'),
+        ('get_variable', 'func_get_variable'),
+        ('import', 'func_import'),
+        ('include_directories', 'func_include_directories'),
+        ('install_data', 'func_install_data'),
+        ('install_emptydir', 'func_install_emptydir'),
+        ('install_headers', 'func_install_headers'),
+        ('install_man', 'func_install_man'),
+        ('install_subdir', 'func_install_subdir'),
+        ('install_symlink', 'func_install_symlink'),
+        ('is_disabler', 'func_is_disabler'),
+        ('is_variable', 'func_is_variable'),
+        ('jar', 'func_jar'),
+        ('join_paths', 'func_join_paths'),
+        ('library', 'func_library'),
+        ('message', 'func_message'),
+        ('option', 'func_option'),
+        ('project', 'func_project'),
+        ('range', 'func_range'),
+        ('run_command', 'func_run_command'),
+        ('run_target', 'func_run_target'),
+        ('set_variable', 'func_set_variable'),
+        ('structured_sources', 'func_structured_sources'),
+        ('subdir', 'func_subdir'),
+        ('shared_library', 'func_shared_lib'),
+        ('shared_module', 'func_shared_module'),
+        ('static_library', 'func_static_lib'),
+        ('subdir_done', 'func_subdir_done'),
+        ('subproject', 'func_subproject'),
+        ('summary', 'func_summary'),
+        ('test', 'func_test'),
+        ('unset_variable', 'func_unset_variable'),
+        ('vcs_tag', 'func_vcs_tag'),
+        ('warning', 'func_warning'),
+    )
+
     def build_func_dict(self) -> None:
-        self.funcs.update({'add_global_arguments': self.func_add_global_arguments,
-                           'add_global_link_arguments': self.func_add_global_link_arguments,
-                           'add_languages': self.func_add_languages,
-                           'add_project_arguments': self.func_add_project_arguments,
-                           'add_project_dependencies': self.func_add_project_dependencies,
-                           'add_project_link_arguments': self.func_add_project_link_arguments,
-                           'add_test_setup': self.func_add_test_setup,
-                           'alias_target': self.func_alias_target,
-                           'assert': self.func_assert,
-                           'benchmark': self.func_benchmark,
-                           'both_libraries': self.func_both_lib,
-                           'build_target': self.func_build_target,
-                           'configuration_data': self.func_configuration_data,
-                           'configure_file': self.func_configure_file,
-                           'custom_target': self.func_custom_target,
-                           'debug': self.func_debug,
-                           'declare_dependency': self.func_declare_dependency,
-                           'dependency': self.func_dependency,
-                           'disabler': self.func_disabler,
-                           'environment': self.func_environment,
-                           'error': self.func_error,
-                           'executable': self.func_executable,
-                           'files': self.func_files,
-                           'find_program': self.func_find_program,
-                           'generator': self.func_generator,
-                           'get_option': self.func_get_option,
-                           'get_variable': self.func_get_variable,
-                           'import': self.func_import,
-                           'include_directories': self.func_include_directories,
-                           'install_data': self.func_install_data,
-                           'install_emptydir': self.func_install_emptydir,
-                           'install_headers': self.func_install_headers,
-                           'install_man': self.func_install_man,
-                           'install_subdir': self.func_install_subdir,
-                           'install_symlink': self.func_install_symlink,
-                           'is_disabler': self.func_is_disabler,
-                           'is_variable': self.func_is_variable,
-                           'jar': self.func_jar,
-                           'join_paths': self.func_join_paths,
-                           'library': self.func_library,
-                           'message': self.func_message,
-                           'option': self.func_option,
-                           'project': self.func_project,
-                           'range': self.func_range,
-                           'run_command': self.func_run_command,
-                           'run_target': self.func_run_target,
-                           'set_variable': self.func_set_variable,
-                           'structured_sources': self.func_structured_sources,
-                           'subdir': self.func_subdir,
-                           'shared_library': self.func_shared_lib,
-                           'shared_module': self.func_shared_module,
-                           'static_library': self.func_static_lib,
-                           'subdir_done': self.func_subdir_done,
-                           'subproject': self.func_subproject,
-                           'summary': self.func_summary,
-                           'test': self.func_test,
-                           'unset_variable': self.func_unset_variable,
-                           'vcs_tag': self.func_vcs_tag,
-                           'warning': self.func_warning,
-                           })
+        self.funcs.update({n: getattr(self, a) for n, a in self.FUNCTIONS})
         if 'MESON_UNIT_TEST' in os.environ:
             self.funcs.update({'exception': self.func_exception})
         if 'MESON_RUNNING_IN_PROJECT_TESTS' in os.environ:
@@ -473,14 +526,17 @@ class Interpreter(InterpreterBase, HoldableObject):
         })
 
     def process_new_values(self, invalues: T.List[T.Union[TYPE_var, ExecutableSerialisation]]) -> None:
-        invalues = listify(invalues)
-        for v in invalues:
+        # Walk the values with an explicit stack, pushing nested values in
+        # reverse so that they are still processed in order.
+        stack = listify(invalues)[::-1]
+        while stack:
+            v = stack.pop()
             if isinstance(v, ObjectHolder):
                 raise InterpreterException('Modules must not return ObjectHolders')
             if isinstance(v, (build.BuildTarget, build.CustomTarget, build.RunTarget)):
                 self.add_target(v.name, v)
             elif isinstance(v, list):
-                self.process_new_values(v)
+                stack.extend(reversed(v))
             elif isinstance(v, ExecutableSerialisation):
                 v.subproject = self.subproject
                 self.build.install_scripts.append(v)
@@ -491,7 +547,7 @@ class Interpreter(InterpreterBase, HoldableObject):
             elif isinstance(v, dependencies.InternalDependency):
                 # FIXME: This is special cased and not ideal:
                 # The first source is our new VapiTarget, the rest are deps
-                self.process_new_values(v.sources[0])
+                stack.extend(reversed(listify(v.sources[0])))
             elif isinstance(v, build.InstallDir):
                 self.build.install_dirs.append(v)
             elif isinstance(v, Test):
@@ -533,9 +589,9 @@ class Interpreter(InterpreterBase, HoldableObject):
             if f.is_built:
                 return
             f = os.path.normpath(f.relative_name())
-        elif os.path.isfile(f) and not f.startswith('/dev/'):
-            srcdir = Path(self.environment.get_source_dir())
-            builddir = Path(self.environment.get_build_dir())
+        elif not f.startswith('/dev/') and os.path.isfile(f):
+            srcdir = self.source_dir_path
+            builddir = self.build_dir_path
             try:
                 f_ = Path(f).resolve()
             except OSError:
@@ -556,8 +612,7 @@ class Interpreter(InterpreterBase, HoldableObject):
             f = str(f_)
         else:
             return
-        if f not in self.build_def_files:
-            self.build_def_files.add(f)
+        self.build_def_files.add(f)
 
     def get_variables(self) -> T.Dict[str, InterpreterObject]:
         return self.variables
@@ -800,7 +855,7 @@ class Interpreter(InterpreterBase, HoldableObject):
         elif isinstance(cmd, compilers.Compiler):
             expanded_args = cmd.get_exe_args()
             cmd = cmd.get_exe()
-            prog = ExternalProgram(cmd, silent=True)
+            prog = self.run_command_program(cmd, None)
             if not prog.found():
                 raise InterpreterException(f'Program {cmd!r} not found or not executable')
             cmd = prog
@@ -809,7 +864,7 @@ class Interpreter(InterpreterBase, HoldableObject):
                 cmd = cmd.absolute_path(srcdir, builddir)
             # Prefer scripts in the current source directory
             search_dir = os.path.join(srcdir, self.subdir)
-            prog = ExternalProgram(cmd, silent=True, search_dirs=[search_dir])
+            prog = self.run_command_program(cmd, search_dir)
             if not prog.found():
                 raise InterpreterException(f'Program or command {cmd!r} not found or not executable')
             cmd = prog
@@ -832,15 +887,34 @@ class Interpreter(InterpreterBase, HoldableObject):
         # If any file that was used as an argument to the command
         # changes, we must re-run the configuration step.
         self.add_build_def_file(cmd.get_path())
+        args_dir = os.path.join(builddir if in_builddir else srcdir, self.subdir)
         for a in expanded_args:
-            if not os.path.isabs(a):
-                a = os.path.join(builddir if in_builddir else srcdir, self.subdir, a)
-            self.add_build_def_file(a)
+            self.add_build_def_file(a if os.path.isabs(a) else os.path.join(args_dir, a))
 
+        if self.introspect_command is None:
+            self.introspect_command = self.environment.get_build_command() + ['introspect']
         return RunProcess(cmd, expanded_args, env, srcdir, builddir, self.subdir,
-                          self.environment.get_build_command() + ['introspect'],
+                          self.introspect_command,
                           in_builddir=in_builddir, check=check, capture=capture)
 
+    def run_command_program(self, cmd: str, search_dir: T.Optional[str]) -> ExternalProgram:
+        """Look up the program used by run_command().
+
+        Found programs are cached, as looking them up means walking PATH.
+        They are never modified by run_command(), unlike the ones returned
+        by find_program(), so sharing them between calls is safe.
+        """
+        key = (cmd, search_dir)
+        prog = self.run_command_programs.get(key)
+        if prog is None:
+            if search_dir is None:
+                prog = ExternalProgram(cmd, silent=True)
+            else:
+                prog = ExternalProgram(cmd, silent=True, search_dirs=[search_dir])
+            if prog.found():
+                self.run_command_programs[key] = prog
+        return prog
+
     def func_option(self, nodes, args, kwargs):
         raise InterpreterException('Tried to call option() in build description file. All options must be in the option file.')
 
@@ -871,6 +945,7 @@ class Interpreter(InterpreterBase, HoldableObject):
     def do_subproject(self, subp_name: str, kwargs: kwtypes.DoSubproject, force_method: T.Optional[wrap.Method] = None) -> SubprojectHolder:
         if subp_name == 'sub_static':
             pass
+        subp_name = sys.intern(subp_name)
         disabled, required, feature = extract_required_kwarg(kwargs, self.subproject)
         if disabled:
             assert feature, 'for mypy'
@@ -879,11 +954,12 @@ class Interpreter(InterpreterBase, HoldableObject):
 
         default_options = kwargs['default_options']
 
-        if subp_name == '':
-            raise InterpreterException('Subproject name must not be empty.')
-        if subp_name[0] == '.':
-            raise InterpreterException('Subproject name must not start with a period.')
-        if '..' in subp_name:
+        invalid = _INVALID_SUBPROJECT_NAME_RE.search(subp_name)
+        if invalid:
+            if not subp_name:
+                raise InterpreterException('Subproject name must not be empty.')
+            if invalid.group() == '.':
+                raise InterpreterException('Subproject name must not start with a period.')
             raise InterpreterException('Subproject name must not contain a ".." path segment.')
         if os.path.isabs(subp_name):
             raise InterpreterException('Subproject name must not be an absolute path.')
@@ -905,10 +981,11 @@ class Interpreter(InterpreterBase, HoldableObject):
                     raise InterpreterException(f'Subproject {subp_name} version is {pv} but {wanted} required.')
             return subproject
 
+        from ..wrap.wrap import WrapException
         r = self.environment.wrap_resolver
         try:
             subdir, method = r.resolve(subp_name, force_method)
-        except wrap.WrapException as e:
+        except WrapException as e:
             if force_method is not None:
                 prefix = force_method.title() + ' subproject'
             else:
@@ -999,7 +1076,6 @@ class Interpreter(InterpreterBase, HoldableObject):
             if pv == 'undefined' or not mesonlib.version_compare_many(pv, wanted)[0]:
                 raise InterpreterException(f'Subproject {subp_name} version is {pv} but {wanted} required.')
         self.active_projectname = current_active
-        self.subprojects.update(subi.subprojects)
         self.subprojects[subp_name] = SubprojectHolder(subi, subdir, warnings=subi_warnings,
                                                        callstack=self.subproject_stack)
         # Duplicates are possible when subproject uses files from project root
@@ -1171,6 +1247,8 @@ class Interpreter(InterpreterBase, HoldableObject):
     )
     def func_project(self, node: mparser.FunctionNode, args: T.Tuple[str, T.List[str]], kwargs: 'kwtypes.Project') -> None:
         proj_name, proj_langs = args
+        # Project and subproject names key many dicts, keep one copy of each
+        proj_name = sys.intern(proj_name)
         if ':' in proj_name:
             raise InvalidArguments(f"Project name {proj_name!r} must not contain ':'")
 
@@ -1226,14 +1304,15 @@ class Interpreter(InterpreterBase, HoldableObject):
             ifname = version.absolute_path(self.environment.source_dir,
                                            self.environment.build_dir)
             try:
-                ver_data = Path(ifname).read_text(encoding='utf-8').split('\n')
+                with open(ifname, encoding='utf-8') as f:
+                    ver_data = f.read()
             except FileNotFoundError:
                 raise InterpreterException('Version file not found.')
-            if len(ver_data) == 2 and ver_data[1] == '':
-                ver_data = ver_data[0:1]
-            if len(ver_data) != 1:
+            if ver_data.endswith('\n'):
+                ver_data = ver_data[:-1]
+            if '\n' in ver_data:
                 raise InterpreterException('Version file must contain exactly one line of text.')
-            self.project_version = ver_data[0]
+            self.project_version = ver_data
         else:
             self.project_version = version
 
@@ -1274,8 +1353,10 @@ class Interpreter(InterpreterBase, HoldableObject):
         # Load wrap files from this (sub)project.
         subprojects_dir = os.path.join(self.subdir, spdirname)
         if not self.is_subproject():
+            # Imported here since it pulls in urllib and friends
+            from ..wrap.wrap import Resolver
             wrap_mode = WrapMode.from_string(self.coredata.optstore.get_value_for(OptionKey('wrap_mode')))
-            self.environment.wrap_resolver = wrap.Resolver(self.environment.get_source_dir(), subprojects_dir, self.subproject, wrap_mode)
+            self.environment.wrap_resolver = Resolver(self.environment.get_source_dir(), subprojects_dir, self.subproject, wrap_mode)
         else:
             assert self.environment.wrap_resolver is not None, 'for mypy'
             self.environment.wrap_resolver.load_and_merge(subprojects_dir, self.subproject)
@@ -1361,9 +1442,9 @@ class Interpreter(InterpreterBase, HoldableObject):
 
     def _print_summary(self) -> None:
         # Add automatic 'Subprojects' section in main project.
-        all_subprojects = collections.OrderedDict()
+        all_subprojects: T.Dict[str, T.List[T.Union[bool, str]]] = {}
         for name, subp in sorted(self.subprojects.items()):
-            value = [subp.found()]
+            value: T.List[T.Union[bool, str]] = [subp.found()]
             if subp.disabled_feature:
                 value += [f'Feature {subp.disabled_feature!r} disabled']
             elif subp.exception:
@@ -1381,7 +1462,7 @@ class Interpreter(InterpreterBase, HoldableObject):
                                })
         # Add automatic section with all user defined options
         if self.user_defined_options:
-            values = collections.OrderedDict()
+            values: T.Dict[str, T.Any] = {}
             if self.user_defined_options.cross_file:
                 values['Cross files'] = self.user_defined_options.cross_file
             if self.user_defined_options.native_file:
@@ -1562,17 +1643,16 @@ class Interpreter(InterpreterBase, HoldableObject):
     def program_from_system(self, args: T.List[mesonlib.FileOrString], search_dirs: T.Optional[T.List[str]],
                             extra_info: T.List[mlog.TV_Loggable]) -> T.Optional[ExternalProgram]:
         # Search for scripts relative to current subdir.
-        # Do not cache found programs because find_program('foobar')
-        # might give different results when run from different source dirs.
-        source_dir = os.path.join(self.environment.get_source_dir(), self.subdir)
+        # Found programs are cached by name and search dirs, as
+        # find_program('foobar') might give different results when run from
+        # different source dirs. find_program() modifies the programs it
+        # returns (e.g. their version_arg), so only copies are handed out.
+        src_root = self.environment.get_source_dir()
+        source_dir = os.path.join(src_root, self.subdir)
         for exename in args:
             if isinstance(exename, mesonlib.File):
-                if exename.is_built:
-                    search_dir = os.path.join(self.environment.get_build_dir(),
-                                              exename.subdir)
-                else:
-                    search_dir = os.path.join(self.environment.get_source_dir(),
-                                              exename.subdir)
+                root = self.environment.get_build_dir() if exename.is_built else src_root
+                search_dir = os.path.join(root, exename.subdir)
                 exename = exename.fname
                 search_dirs = [search_dir]
             elif isinstance(exename, str):
@@ -1582,28 +1662,32 @@ class Interpreter(InterpreterBase, HoldableObject):
                     search_dirs = [source_dir]
             else:
                 raise InvalidArguments(f'find_program only accepts strings and files, not {exename!r}')
-            extprog = ExternalProgram(exename, search_dirs=search_dirs, silent=True)
-            if extprog.found():
-                extra_info.append(f"({' '.join(extprog.get_command())})")
-                return extprog
+            key = (exename, tuple(search_dirs))
+            extprog = self.system_programs.get(key)
+            if extprog is None:
+                extprog = ExternalProgram(exename, search_dirs=search_dirs, silent=True)
+                if not extprog.found():
+                    continue
+                self.system_programs[key] = extprog
+            extra_info.append(f"({' '.join(extprog.get_command())})")
+            return copy.copy(extprog)
         return None
 
     def program_from_overrides(self, command_names: T.List[mesonlib.FileOrString],
                                extra_info: T.List['mlog.TV_Loggable']
                                ) -> T.Optional[T.Union[ExternalProgram, OverrideProgram, build.Executable]]:
+        find_overrides = self.build.find_overrides
         for name in command_names:
             if not isinstance(name, str):
                 continue
-            if name in self.build.find_overrides:
-                exe = self.build.find_overrides[name]
+            exe = find_overrides.get(name)
+            if exe is not None:
                 extra_info.append(mlog.blue('(overridden)'))
                 return exe
         return None
 
     def store_name_lookups(self, command_names: T.List[mesonlib.FileOrString]) -> None:
-        for name in command_names:
-            if isinstance(name, str):
-                self.build.searched_programs.add(name)
+        self.build.searched_programs.update(name for name in command_names if isinstance(name, str))
 
     def add_find_program_override(self, name: str, exe: T.Union[build.Executable, ExternalProgram, 'OverrideProgram']) -> None:
         if name in self.build.searched_programs:
@@ -1682,8 +1766,11 @@ class Interpreter(InterpreterBase, HoldableObject):
         if progobj is None:
             progobj = self.program_from_system(args, search_dirs, extra_info)
         if progobj is None and args[0].endswith('python3'):
-            prog = ExternalProgram('python3', mesonlib.python_command, silent=True)
-            progobj = prog if prog.found() else None
+            if self.python3_program is None:
+                self.python3_program = ExternalProgram('python3', mesonlib.python_command, silent=True)
+            # Hand out a copy, the version_arg may be changed below
+            prog = self.python3_program
+            progobj = copy.copy(prog) if prog.found() else None
 
         if isinstance(progobj, ExternalProgram) and version_arg:
             progobj.version_arg = version_arg
@@ -2016,17 +2103,17 @@ class Interpreter(InterpreterBase, HoldableObject):
         This cannot be done with typed_kwargs because it requires the number of
         inputs.
         """
-        inregex: T.List[str] = ['@PLAINNAME[0-9]+@', '@BASENAME[0-9]+@']
-        from ..utils.universal import iter_regexin_iter
         for out in outputs:
-            match = iter_regexin_iter(inregex, [out])
             if has_multi_in and ('@PLAINNAME@' in out or '@BASENAME@' in out):
                 raise InvalidArguments(f'{name}: output cannot contain "@PLAINNAME@" or "@BASENAME@" '
                                        'when there is more than one input (we can\'t know which to use)')
-            elif match:
-                FeatureNew.single_use(
-                    f'{match} in output', '1.5.0',
-                    self.subproject)
+            for regex in _INDEXED_OUTPUT_SUBST_RES:
+                match = regex.search(out)
+                if match:
+                    FeatureNew.single_use(
+                        f'{match.group()} in output', '1.5.0',
+                        self.subproject)
+                    break
 
     @typed_pos_args('custom_target', optargs=[str])
     @typed_kwargs(
@@ -2153,7 +2240,8 @@ class Interpreter(InterpreterBase, HoldableObject):
                         kwargs: 'kwtypes.RunTarget') -> build.RunTarget:
         all_args = kwargs['command'].copy()
 
-        for i in listify(all_args):
+        # typed_kwargs has already flattened and type checked the command
+        for i in all_args:
             if isinstance(i, ExternalProgram) and not i.found():
                 raise InterpreterException(f'Tried to use non-existing executable {i.name!r}')
         if isinstance(all_args[0], str):
@@ -2225,6 +2313,9 @@ class Interpreter(InterpreterBase, HoldableObject):
         envlist = kwargs.get('env')
         if envlist is None:
             return EnvironmentVariables()
+        if isinstance(envlist, EnvironmentVariables):
+            # Already validated and converted by typed_kwargs
+            return envlist
         msg = ENV_KW.validator(envlist)
         if msg:
             raise InvalidArguments(f'"env": {msg}')
@@ -2257,11 +2348,8 @@ class Interpreter(InterpreterBase, HoldableObject):
 
         prj = self.subproject if self.is_subproject() else self.build.project_name
 
-        suite: T.List[str] = []
-        for s in kwargs['suite']:
-            if s:
-                s = ':' + s
-            suite.append(prj.replace(' ', '_').replace(':', '_') + s)
+        suite_prefix = prj.replace(' ', '_').replace(':', '_')
+        suite = [f'{suite_prefix}:{s}' if s else suite_prefix for s in kwargs['suite']]
 
         return klass(name,
                      prj,
@@ -2450,13 +2538,14 @@ class Interpreter(InterpreterBase, HoldableObject):
             if not i.found():
                 return
 
-        subdir, is_new = self._resolve_subdir(self.environment.get_source_dir(), args[0])
+        source_dir = self.environment.get_source_dir()
+        subdir, is_new = self._resolve_subdir(source_dir, args[0])
         if not is_new:
             raise InvalidArguments(f'Tried to enter directory "{subdir}", which has already been visited.')
 
         os.makedirs(os.path.join(self.environment.build_dir, subdir), exist_ok=True)
 
-        if not self._evaluate_subdir(self.environment.get_source_dir(), subdir):
+        if not self._evaluate_subdir(source_dir, subdir):
             buildfilename = os.path.join(subdir, environment.build_filename)
             raise InterpreterException(f"Nonexistent build file '{buildfilename!s}'")
 
@@ -2650,10 +2739,11 @@ class Interpreter(InterpreterBase, HoldableObject):
         # Validate input
         inputs = self.source_strings_to_files(kwargs['input'])
         inputs_abs = []
+        source_dir = self.environment.source_dir
+        build_dir = self.environment.build_dir
         for f in inputs:
             if isinstance(f, mesonlib.File):
-                inputs_abs.append(f.absolute_path(self.environment.source_dir,
-                                                  self.environment.build_dir))
+                inputs_abs.append(f.absolute_path(source_dir, build_dir))
                 self.add_build_def_file(f)
             else:
                 raise InterpreterException('Inputs can only be strings or file objects')
@@ -2675,7 +2765,7 @@ class Interpreter(InterpreterBase, HoldableObject):
         else:
             self.configure_file_outputs[ofile_rpath] = self.current_node.lineno
         (ofile_path, ofile_fname) = os.path.split(os.path.join(self.subdir, output))
-        ofile_abs = os.path.join(self.environment.build_dir, ofile_path, ofile_fname)
+        ofile_abs = os.path.join(build_dir, ofile_path, ofile_fname)
 
         # Perform the appropriate action
         if kwargs['configuration'] is not None:
@@ -2691,7 +2781,7 @@ class Interpreter(InterpreterBase, HoldableObject):
             if len(inputs) > 1:
                 raise InterpreterException('At most one input file can given in configuration mode')
             if inputs:
-                os.makedirs(os.path.join(self.environment.build_dir, self.subdir), exist_ok=True)
+                os.makedirs(os.path.join(build_dir, self.subdir), exist_ok=True)
                 file_encoding = kwargs['encoding']
                 missing_variables, confdata_useless = \
                     mesonlib.do_conf_file(inputs_abs[0], ofile_abs, conf,
@@ -2719,12 +2809,16 @@ class Interpreter(InterpreterBase, HoldableObject):
             # We use absolute paths for input and output here because the cwd
             # that the command is run from is 'unspecified', so it could change.
             # Currently it's builddir/subdir for in_builddir else srcdir/subdir.
-            values = mesonlib.get_filenames_templates_dict(inputs_abs, [ofile_abs])
             if depfile:
                 depfile = os.path.join(self.environment.get_scratch_dir(), depfile)
-                values['@DEPFILE@'] = depfile
-            # Substitute @INPUT@, @OUTPUT@, etc here.
-            _cmd = mesonlib.substitute_values(kwargs['command'], values)
+            _cmd = kwargs['command']
+            # Substitute @INPUT@, @OUTPUT@, etc here. Every template contains
+            # an '@', so without one there is nothing to substitute or check.
+            if any(isinstance(c, str) and '@' in c for c in _cmd):
+                values = mesonlib.get_filenames_templates_dict(inputs_abs, [ofile_abs])
+                if depfile:
+                    values['@DEPFILE@'] = depfile
+                _cmd = mesonlib.substitute_values(_cmd, values)
             mlog.log('Configuring', mlog.bold(output), 'with command')
             cmd, *args = _cmd
             res = self.run_command_impl((cmd, args),
@@ -2749,8 +2843,20 @@ class Interpreter(InterpreterBase, HoldableObject):
         elif kwargs['copy']:
             if len(inputs_abs) != 1:
                 raise InterpreterException('Exactly one input file must be given in copy mode')
-            os.makedirs(os.path.join(self.environment.build_dir, self.subdir), exist_ok=True)
-            shutil.copy2(inputs_abs[0], ofile_abs)
+            os.makedirs(os.path.join(build_dir, self.subdir), exist_ok=True)
+            # copy2() carries over size, mode and mtime, so if all of them
+            # still match and so do the contents, the output is from a
+            # previous copy of this input
+            try:
+                src_st = os.stat(inputs_abs[0])
+                dst_st = os.stat(ofile_abs)
+                up_to_date = ((src_st.st_size, src_st.st_mode, src_st.st_mtime_ns) ==
+                              (dst_st.st_size, dst_st.st_mode, dst_st.st_mtime_ns) and
+                              filecmp.cmp(inputs_abs[0], ofile_abs, shallow=False))
+            except FileNotFoundError:
+                up_to_date = False
+            if not up_to_date:
+                shutil.copy2(inputs_abs[0], ofile_abs)
 
         # Install file if requested, we check for the empty string
         # for backwards compatibility. That was the behaviour before
@@ -2813,8 +2919,10 @@ class Interpreter(InterpreterBase, HoldableObject):
         absbase_src = os.path.join(src_root, self.subdir)
         absbase_build = os.path.join(build_root, self.subdir)
 
+        src_root_path = Path(src_root)
         for a in incdir_strings:
-            if path_is_in_root(Path(a), Path(src_root)):
+            # A relative path can never point into the source root
+            if os.path.isabs(a) and path_is_in_root(Path(a), src_root_path):
                 raise InvalidArguments(textwrap.dedent('''\
                     Tried to form an absolute path to a dir in the source tree.
                     You should not do that but use relative paths instead, for
@@ -2867,7 +2975,13 @@ class Interpreter(InterpreterBase, HoldableObject):
                         '''))
             absdir_src = os.path.join(absbase_src, a)
             absdir_build = os.path.join(absbase_build, a)
-            if not os.path.isdir(absdir_src) and not os.path.isdir(absdir_build):
+            if absdir_src in self.existing_incdirs or absdir_build in self.existing_incdirs:
+                continue
+            if os.path.isdir(absdir_src):
+                self.existing_incdirs.add(absdir_src)
+            elif os.path.isdir(absdir_build):
+                self.existing_incdirs.add(absdir_build)
+            else:
                 raise InvalidArguments(f'Include dir {a} does not exist.')
         i = build.IncludeDirs(self.subdir, incdir_strings, is_system)
         return i
@@ -2884,7 +2998,7 @@ class Interpreter(InterpreterBase, HoldableObject):
     )
     def func_add_test_setup(self, node: mparser.BaseNode, args: T.Tuple[str], kwargs: 'kwtypes.AddTestSetup') -> None:
         setup_name = args[0]
-        if re.fullmatch('([_a-zA-Z][_0-9a-zA-Z]*:)?[_a-zA-Z][_0-9a-zA-Z]*', setup_name) is None:
+        if _SETUP_NAME_RE.fullmatch(setup_name) is None:
             raise InterpreterException('Setup name may only contain alphanumeric characters.')
         if ":" not in setup_name:
             setup_name = f'{(self.subproject if self.subproject else self.build.project_name)}:{setup_name}'
@@ -2952,32 +3066,18 @@ class Interpreter(InterpreterBase, HoldableObject):
             self._add_project_arguments(node, self.build.projects_link_args[for_machine], d.get_link_args(), kwargs)
 
     def _warn_about_builtin_args(self, args: T.List[str]) -> None:
-        # -Wpedantic is deliberately not included, since some people want to use it but not use -Wextra
-        # see e.g.
-        # https://github.com/mesonbuild/meson/issues/3275#issuecomment-641354956
-        # https://github.com/mesonbuild/meson/issues/3742
-        warnargs = ('/W1', '/W2', '/W3', '/W4', '/Wall', '-Wall', '-Wextra')
-        optargs = ('-O0', '-O2', '-O3', '-Os', '-Oz', '/O1', '/O2', '/Os')
         for arg in args:
-            if arg in warnargs:
-                mlog.warning(f'Consider using the built-in warning_level option instead of using "{arg}".',
-                             location=self.current_node)
-            elif arg in optargs:
-                mlog.warning(f'Consider using the built-in optimization level instead of using "{arg}".',
-                             location=self.current_node)
-            elif arg == '-Werror':
-                mlog.warning(f'Consider using the built-in werror option instead of using "{arg}".',
-                             location=self.current_node)
-            elif arg == '-g':
-                mlog.warning(f'Consider using the built-in debug option instead of using "{arg}".',
-                             location=self.current_node)
-            # Don't catch things like `-fsanitize-recover`
-            elif arg in {'-fsanitize', '/fsanitize'} or arg.startswith(('-fsanitize=', '/fsanitize=')):
-                mlog.warning(f'Consider using the built-in option for sanitizers instead of using "{arg}".',
-                             location=self.current_node)
-            elif arg.startswith('-std=') or arg.startswith('/std:'):
-                mlog.warning(f'Consider using the built-in option for language standard version instead of using "{arg}".',
-                             location=self.current_node)
+            option = _BUILTIN_ARG_OPTIONS.get(arg)
+            if option is None:
+                # Don't catch things like `-fsanitize-recover`
+                if arg.startswith(('-fsanitize=', '/fsanitize=')):
+                    option = 'option for sanitizers'
+                elif arg.startswith(('-std=', '/std:')):
+                    option = 'option for language standard version'
+                else:
+                    continue
+            mlog.warning(f'Consider using the built-in {option} instead of using "{arg}".',
+                         location=self.current_node)
 
     def _add_global_arguments(self, node: mparser.FunctionNode, argsdict: T.Dict[str, T.List[str]],
                               args: T.List[str], kwargs: 'kwtypes.FuncAddProjectArgs') -> None:
@@ -3009,7 +3109,7 @@ class Interpreter(InterpreterBase, HoldableObject):
         self._warn_about_builtin_args(args)
 
         for lang in kwargs['language']:
-            argsdict[lang] = argsdict.get(lang, []) + args
+            argsdict.setdefault(lang, []).extend(args)
 
     @noArgsFlattening
     @typed_pos_args('environment', optargs=[(str, list, dict)])
@@ -3106,10 +3206,10 @@ class Interpreter(InterpreterBase, HoldableObject):
                 return
 
         def do_validate_within_subproject(norm: str) -> None:
-            if os.path.isdir(norm):
-                inputtype = 'directory'
-            else:
-                inputtype = 'file'
+            # Only stat the path if we have to report an error for it
+            def inputtype() -> str:
+                return 'directory' if os.path.isdir(norm) else 'file'
+
             if InterpreterRuleRelaxation.ALLOW_BUILD_DIR_FILE_REFERENCES in self.relaxations and is_parent_path(builddir, norm):
                 return
 
@@ -3123,12 +3223,12 @@ class Interpreter(InterpreterBase, HoldableObject):
             project_root = os.path.join(srcdir, self.root_subdir)
             if not is_parent_path(project_root, norm):
                 name = os.path.basename(norm)
-                raise InterpreterException(f'Sandbox violation: Tried to grab {inputtype} {name} outside current (sub)project.')
+                raise InterpreterException(f'Sandbox violation: Tried to grab {inputtype()} {name} outside current (sub)project.')
 
             subproject_dir = os.path.join(project_root, self.subproject_dir)
             if is_parent_path(subproject_dir, norm):
                 name = os.path.basename(norm)
-                raise InterpreterException(f'Sandbox violation: Tried to grab {inputtype} {name} from a nested subproject.')
+                raise InterpreterException(f'Sandbox violation: Tried to grab {inputtype()} {name} from a nested subproject.')
 
         fname = os.path.join(subdir, fname)
         if fname in self.validated_cache:
@@ -3164,18 +3264,28 @@ class Interpreter(InterpreterBase, HoldableObject):
         mesonlib.check_direntry_issues(sources)
         if not isinstance(sources, list):
             sources = [sources]
+        # Most often everything already came from files(), nothing to convert
+        for s in sources:
+            if type(s) is not mesonlib.File:
+                break
+        else:
+            return T.cast('T.List[SourceOutputs]', sources.copy())
         results: T.List['SourceOutputs'] = []
+        source_dir = self.environment.source_dir
+        build_dir = self.environment.get_build_dir()
+        subdir = self.subdir
+        from_source_file = mesonlib.File.from_source_file
         for s in sources:
             if isinstance(s, str):
                 if s.endswith(' '):
                     raise MesonException(f'{s!r} ends with a space. This is probably an error.')
-                if not strict and s.startswith(self.environment.get_build_dir()):
+                if not strict and s.startswith(build_dir):
                     results.append(s)
                     mlog.warning(f'Source item {s!r} cannot be converted to File object, because it is a generated file. '
                                  'This will become a hard error in meson 2.0.', location=self.current_node)
                 else:
-                    self.validate_within_subproject(self.subdir, s)
-                    results.append(mesonlib.File.from_source_file(self.environment.source_dir, self.subdir, s))
+                    self.validate_within_subproject(subdir, s)
+                    results.append(from_source_file(source_dir, subdir, s))
             elif isinstance(s, mesonlib.File):
                 results.append(s)
             elif isinstance(s, (build.GeneratedList, build.BuildTarget,
@@ -3236,12 +3346,16 @@ class Interpreter(InterpreterBase, HoldableObject):
         self.build.targets[idname] = tobj
         # Only need to add executables to this set
         if isinstance(tobj, build.Executable):
-            self.build.targetnames.update([namedir])
+            self.build.targetnames.add(namedir)
         if idname not in self.coredata.target_guids:
             self.coredata.target_guids[idname] = str(uuid.uuid4()).upper()
 
     @FeatureNew('both_libraries', '0.46.0')
     def build_both_libraries(self, node: mparser.BaseNode, args: T.Tuple[str, SourcesVarargsType], kwargs: kwtypes.Library) -> build.BothLibraries:
+        # Both libraries are built from the same sources, so look up and
+        # validate source strings only once
+        args = (args[0], self.source_strings_to_files(args[1]))
+        kwargs['sources'] = self.source_strings_to_files(kwargs['sources'])
         shared_lib = self.build_target(node, args, kwargs, build.SharedLibrary)
         static_lib = self.build_target(node, args, kwargs, build.StaticLibrary)
         preferred_library = self.coredata.optstore.get_value_for(OptionKey('default_both_libraries'))
@@ -3370,18 +3484,22 @@ class Interpreter(InterpreterBase, HoldableObject):
             for_machine = MachineChoice.BUILD
         # Avoid mutating, since there could be other references to sources
         sources = sources + kwargs['sources']
-        if any(isinstance(s, build.BuildTarget) for s in sources):
-            FeatureBroken.single_use('passing references to built targets as a source file', '1.1.0', self.subproject,
-                                     'Consider using `link_with` or `link_whole` if you meant to link, or dropping them as otherwise they are ignored.',
-                                     node)
-        if any(isinstance(s, build.ExtractedObjects) for s in sources):
-            FeatureBroken.single_use('passing object files as sources', '1.1.0', self.subproject,
-                                     'Pass these to the `objects` keyword instead, they are ignored when passed as sources.',
-                                     node)
-        # Go ahead and drop these here, since they're only allowed through for
-        # backwards compatibility anyway
-        sources = [s for s in sources
-                   if not isinstance(s, (build.BuildTarget, build.ExtractedObjects))]
+        # Built targets and extracted objects are almost never passed as
+        # sources, so only look at them more closely if there are any
+        ignored = [s for s in sources if isinstance(s, (build.BuildTarget, build.ExtractedObjects))]
+        if ignored:
+            if any(isinstance(s, build.BuildTarget) for s in ignored):
+                FeatureBroken.single_use('passing references to built targets as a source file', '1.1.0', self.subproject,
+                                         'Consider using `link_with` or `link_whole` if you meant to link, or dropping them as otherwise they are ignored.',
+                                         node)
+            if any(isinstance(s, build.ExtractedObjects) for s in ignored):
+                FeatureBroken.single_use('passing object files as sources', '1.1.0', self.subproject,
+                                         'Pass these to the `objects` keyword instead, they are ignored when passed as sources.',
+                                         node)
+            # Go ahead and drop these here, since they're only allowed through for
+            # backwards compatibility anyway
+            sources = [s for s in sources
+                       if not isinstance(s, (build.BuildTarget, build.ExtractedObjects))]
 
         # due to lack of type checking, these are "allowed" for legacy reasons
         if not isinstance(kwargs['install'], bool):
@@ -3393,7 +3511,6 @@ class Interpreter(InterpreterBase, HoldableObject):
         objs = kwargs['objects']
         kwargs['dependencies'] = extract_as_list(kwargs, 'dependencies')
         kwargs['extra_files'] = self.source_strings_to_files(kwargs['extra_files'])
-        self.check_sources_exist(os.path.join(self.source_root, self.subdir), sources)
         if targetclass not in {build.Executable, build.SharedLibrary, build.SharedModule, build.StaticLibrary, build.Jar}:
             mlog.debug('Unknown target type:', str(targetclass))
             raise RuntimeError('Unreachable code')
@@ -3414,7 +3531,8 @@ class Interpreter(InterpreterBase, HoldableObject):
 
         # Filter out kwargs from other target types. For example 'soversion'
         # passed to library() when default_library == 'static'.
-        kwargs = {k: v for k, v in kwargs.items() if k in targetclass.known_kwargs | {'language_args'}}
+        known_kwargs = targetclass.known_kwargs | {'language_args'}
+        kwargs = {k: v for k, v in kwargs.items() if k in known_kwargs}
 
         srcs: T.List['SourceInputs'] = []
         struct: T.Optional[build.StructuredSources] = build.StructuredSources()
@@ -3491,14 +3609,6 @@ class Interpreter(InterpreterBase, HoldableObject):
             if dep:
                 target.add_deps(dep)
 
-    def check_sources_exist(self, subdir, sources):
-        for s in sources:
-            if not isinstance(s, str):
-                continue # This means a generated source and they always exist.
-            fname = os.path.join(subdir, s)
-            if not os.path.isfile(fname):
-                raise InterpreterException(f'Tried to add non-existing source file {s}.')
-
     def check_for_jar_sources(self, sources, targetclass):
         for s in sources:
             if isinstance(s, (str, mesonlib.File)) and compilers.is_java(s):
@@ -3561,7 +3671,7 @@ class Interpreter(InterpreterBase, HoldableObject):
         native = kwargs.get('native', False)
         if not isinstance(native, bool):
             raise InvalidArguments('Argument to "native" must be a boolean.')
-        return MachineChoice.BUILD if native else MachineChoice.HOST
+        return _BUILD_MACHINE if native else _HOST_MACHINE
 
     @FeatureNew('is_disabler', '0.52.0')
     @typed_pos_args('is_disabler', object)
@@ -743,7 +743,7 @@ class MachineHolder(ObjectHolder['MachineInfo']):
 
 
 class IncludeDirsHolder(ObjectHolder[build.IncludeDirs]):
-    pass
+    __slots__ = ()
 
 class FileHolder(ObjectHolder[mesonlib.File]):
     def __init__(self, file: mesonlib.File, interpreter: 'Interpreter'):
@@ -822,6 +822,9 @@ class NullSubprojectInterpreter(HoldableObject):
 #       `ObjectHolder` and a class specifically for storing in `Interpreter`.
 class SubprojectHolder(MesonInterpreterObject):
 
+    __slots__ = ('held_object', 'warnings', 'disabled_feature', 'exception',
+                 'subdir', 'cm_interpreter', 'callstack')
+
     def __init__(self, subinterpreter: T.Union['Interpreter', NullSubprojectInterpreter],
                  subdir: str,
                  warnings: int = 0,
@@ -903,6 +906,9 @@ class MutableModuleObjectHolder(ModuleObjectHolder, MutableInterpreterObject):
 _BuildTarget = T.TypeVar('_BuildTarget', bound=T.Union[build.BuildTarget, build.BothLibraries])
 
 class BuildTargetHolder(ObjectHolder[_BuildTarget]):
+
+    __slots__ = ()
+
     def __init__(self, target: _BuildTarget, interp: 'Interpreter'):
         super().__init__(target, interp)
         self.methods.update({'extract_objects': self.extract_objects_method,
@@ -999,15 +1005,18 @@ class BuildTargetHolder(ObjectHolder[_BuildTarget]):
         return self._target_object.name
 
 class ExecutableHolder(BuildTargetHolder[build.Executable]):
-    pass
+    __slots__ = ()
 
 class StaticLibraryHolder(BuildTargetHolder[build.StaticLibrary]):
-    pass
+    __slots__ = ()
 
 class SharedLibraryHolder(BuildTargetHolder[build.SharedLibrary]):
-    pass
+    __slots__ = ()
 
 class BothLibrariesHolder(BuildTargetHolder[build.BothLibraries]):
+
+    __slots__ = ()
+
     def __init__(self, libs: build.BothLibraries, interp: 'Interpreter'):
         super().__init__(libs, interp)
         self.methods.update({'get_shared_lib': self.get_shared_lib_method,
@@ -1035,10 +1044,10 @@ class BothLibrariesHolder(BuildTargetHolder[build.BothLibraries]):
         return lib
 
 class SharedModuleHolder(BuildTargetHolder[build.SharedModule]):
-    pass
+    __slots__ = ()
 
 class JarHolder(BuildTargetHolder[build.Jar]):
-    pass
+    __slots__ = ()
 
 class CustomTargetIndexHolder(ObjectHolder[build.CustomTargetIndex]):
     def __init__(self, target: build.CustomTargetIndex, interp: 'Interpreter'):
@@ -4,6 +4,7 @@
 """Helpers for strict type checking."""
 
 from __future__ import annotations
+from functools import lru_cache
 import itertools, os, re
 import typing as T
 
@@ -98,11 +99,18 @@ def _install_mode_validator(mode: T.List[T.Union[str, bool, int]]) -> T.Optional
     return None
 
 
+@lru_cache(maxsize=None)
+def _file_mode(perms: T.Optional[str] = None, owner: T.Union[str, int, None] = None,
+               group: T.Union[str, int, None] = None) -> FileMode:
+    """Get a shared FileMode, they are never modified after creation"""
+    return FileMode(perms, owner, group)
+
+
 def _install_mode_convertor(mode: T.Optional[T.List[T.Union[str, bool, int]]]) -> FileMode:
     """Convert the DSL form of the `install_mode` keyword argument to `FileMode`"""
 
     if not mode:
-        return FileMode()
+        return _file_mode()
 
     # This has already been validated by the validator. False denotes "use
     # default". mypy is totally incapable of understanding it, because
@@ -111,7 +119,7 @@ def _install_mode_convertor(mode: T.Optional[T.List[T.Union[str, bool, int]]]) -
     m1 = mode[0] if isinstance(mode[0], str) else None
     rest = (m if isinstance(m, (str, int)) else None for m in mode[1:])
 
-    return FileMode(m1, *rest)
+    return _file_mode(m1, *rest)
 
 
 def _lower_strlist(input: T.List[str]) -> T.List[str]:
@@ -129,6 +137,9 @@ def _validate_shlib_version(val: T.Optional[str]) -> T.Optional[str]:
     return None
 
 
+_WHITESPACE_RE = re.compile(r'\s')
+
+
 def variables_validator(contents: T.Union[str, T.List[str], T.Dict[str, str]]) -> T.Optional[str]:
     if isinstance(contents, str):
         contents = [contents]
@@ -142,10 +153,10 @@ def variables_validator(contents: T.Union[str, T.List[str], T.Dict[str, str]]) -
             except ValueError:
                 return f'variable {v!r} must have a value separated by equals sign.'
             variables[key.strip()] = val.strip()
-    for k, v in variables.items():
+    for k in variables:
         if not k:
             return 'empty variable name'
-        if any(c.isspace() for c in k):
+        if _WHITESPACE_RE.search(k):
             return f'invalid whitespace in variable name {k!r}'
     return None
 
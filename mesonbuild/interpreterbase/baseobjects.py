@@ -38,6 +38,9 @@ TYPE_key_resolver = T.Callable[[mparser.BaseNode], str]
 SubProject = T.NewType('SubProject', str)
 
 class InterpreterObject:
+
+    __slots__ = ('methods', 'operators', 'trivial_operators', 'current_node', 'subproject')
+
     def __init__(self, *, subproject: T.Optional['SubProject'] = None) -> None:
         self.methods: T.Dict[
             str,
@@ -118,6 +121,8 @@ class InterpreterObject:
 class MesonInterpreterObject(InterpreterObject):
     ''' All non-elementary objects and non-object-holders should be derived from this '''
 
+    __slots__ = ()
+
 class MutableInterpreterObject:
     ''' Dummy class to mark the object type as mutable '''
 
@@ -126,6 +131,9 @@ TYPE_HoldableTypes = T.Union[TYPE_var, HoldableObject]
 InterpreterObjectTypeVar = T.TypeVar('InterpreterObjectTypeVar', bound=TYPE_HoldableTypes)
 
 class ObjectHolder(InterpreterObject, T.Generic[InterpreterObjectTypeVar]):
+
+    __slots__ = ('held_object', 'interpreter', 'env')
+
     def __init__(self, obj: InterpreterObjectTypeVar, interpreter: 'Interpreter') -> None:
         super().__init__(subproject=interpreter.subproject)
         # This causes some type checkers to assume that obj is a base
@@ -90,13 +90,13 @@ def disablerIfNotFound(f: TV_func) -> TV_func:
 
 @dataclass(repr=False, eq=False)
 class permittedKwargs:
-    permitted: T.Set[str]
+    permitted: T.AbstractSet[str]
 
     def __call__(self, f: TV_func) -> TV_func:
         @wraps(f)
         def wrapped(*wrapped_args: T.Any, **wrapped_kwargs: T.Any) -> T.Any:
             kwargs = get_callee_args(wrapped_args)[2]
-            unknowns = set(kwargs).difference(self.permitted)
+            unknowns = kwargs.keys() - self.permitted
             if unknowns:
                 ustr = ', '.join([f'"{u}"' for u in sorted(unknowns)])
                 raise InvalidArguments(f'Got unknown keyword arguments {ustr}')
@@ -8,6 +8,7 @@ from .exceptions import InterpreterException, InvalidArguments
 from ..options import UserOption
 
 
+from functools import lru_cache
 import collections.abc
 import typing as T
 
@@ -33,13 +34,29 @@ def flatten(args: T.Union['TYPE_var', T.List['TYPE_var']]) -> T.List['TYPE_var']
 
 def resolve_second_level_holders(args: T.List['TYPE_var'], kwargs: 'TYPE_kwargs') -> T.Tuple[T.List['TYPE_var'], 'TYPE_kwargs']:
     def resolver(arg: 'TYPE_var') -> 'TYPE_var':
-        if isinstance(arg, list):
-            return [resolver(x) for x in arg]
-        if isinstance(arg, dict):
-            return {k: resolver(v) for k, v in arg.items()}
-        if isinstance(arg, mesonlib.SecondLevelHolder):
-            return arg.get_default_object()
-        return arg
+        if not isinstance(arg, (list, dict)):
+            if isinstance(arg, mesonlib.SecondLevelHolder):
+                return arg.get_default_object()
+            return arg
+        # Walk nested containers with an explicit stack of (container, slot,
+        # value) frames, filling in preallocated copies of the containers.
+        root: T.List['TYPE_var'] = [arg]
+        stack: T.List[T.Tuple[T.Any, T.Any, 'TYPE_var']] = [(root, 0, arg)]
+        while stack:
+            parent, slot, item = stack.pop()
+            if isinstance(item, list):
+                new_list: T.List['TYPE_var'] = [None] * len(item)
+                parent[slot] = new_list
+                stack.extend((new_list, i, x) for i, x in enumerate(item))
+            elif isinstance(item, dict):
+                new_dict: T.Dict[str, 'TYPE_var'] = dict.fromkeys(item)
+                parent[slot] = new_dict
+                stack.extend((new_dict, k, v) for k, v in item.items())
+            elif isinstance(item, mesonlib.SecondLevelHolder):
+                parent[slot] = item.get_default_object()
+            else:
+                parent[slot] = item
+        return root[0]
     return [resolver(x) for x in args], {k: resolver(v) for k, v in kwargs.items()}
 
 def default_resolve_key(key: mparser.BaseNode) -> str:
@@ -47,13 +64,18 @@ def default_resolve_key(key: mparser.BaseNode) -> str:
         raise InterpreterException('Invalid kwargs format.')
     return key.value
 
+@lru_cache(maxsize=4096, typed=True)
+def _stringify_scalar(arg: T.Union[str, int, bool], quote: bool) -> str:
+    # typed=True keeps True and 1 (which hash equal) in separate entries
+    if isinstance(arg, str):
+        return f"'{arg}'" if quote else arg
+    elif isinstance(arg, bool):
+        return 'true' if arg else 'false'
+    return str(arg)
+
 def stringifyUserArguments(args: TYPE_var, subproject: SubProject, quote: bool = False) -> str:
-    if isinstance(args, str):
-        return f"'{args}'" if quote else args
-    elif isinstance(args, bool):
-        return 'true' if args else 'false'
-    elif isinstance(args, int):
-        return str(args)
+    if isinstance(args, (str, int)):
+        return _stringify_scalar(args, quote)
     elif isinstance(args, list):
         return '[%s]' % ', '.join([stringifyUserArguments(x, subproject, True) for x in args])
     elif isinstance(args, dict):
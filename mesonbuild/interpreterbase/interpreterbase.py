@@ -76,6 +76,8 @@ class InterpreterBase:
         # Holder maps store a mapping from an HoldableObject to a class ObjectHolder
         self.holder_map: HolderMapType = {}
         self.bound_holder_map: HolderMapType = {}
+        # Holder classes found in bound_holder_map, by the concrete type
+        self._bound_holder_cache: HolderMapType = {}
         self.build_def_files: mesonlib.OrderedSet[str] = mesonlib.OrderedSet()
         self.processed_buildfiles: T.Set[str] = set()
         self.subdir = subdir
@@ -573,9 +575,14 @@ class InterpreterBase:
                 # Casts to Interpreter are required here since an assertion would
                 # not work for the `ast` module.
                 return cls(res, T.cast('Interpreter', self))
-            # Try the boundary types next.
+            # Try the boundary types next, and remember the result so that
+            # further objects of the same type only need one lookup.
+            cls = self._bound_holder_cache.get(type(res), None)
+            if cls is not None:
+                return cls(res, T.cast('Interpreter', self))
             for typ, cls in self.bound_holder_map.items():
                 if isinstance(res, typ):
+                    self._bound_holder_cache[type(res)] = cls
                     return cls(res, T.cast('Interpreter', self))
             raise mesonlib.MesonBugException(f'Object {res} of type {type(res).__name__} is neither in self.holder_map nor self.bound_holder_map.')
         elif isinstance(res, ObjectHolder):
@@ -74,6 +74,9 @@ RUST_TEST_KWS: T.List[KwargInfo] = [
      KwargInfo('is_parallel', bool, default=False),
 ]
 
+# Characters that are not wanted in the name of a bindgen target
+_BINDGEN_NAME_TRANS = str.maketrans('/\\: ', '____')
+
 def no_spaces_validator(arg: T.Optional[T.Union[str, T.List]]) -> T.Optional[str]:
     if any(bool(re.search(r'\s', x)) for x in arg):
         return 'must not contain spaces due to limitations of rustdoc'
@@ -155,22 +158,21 @@ class RustModule(ExtensionModule):
         base_target: BuildTarget = args[1]
         if not base_target.uses_rust():
             raise InterpreterException(f'Second positional argument to rustmod.{funcname}() must be a rust based target')
-        extra_args = kwargs['args']
 
         # Delete any arguments we don't want passed
-        if '--test' in extra_args:
-            mlog.warning(f'Do not add --test to rustmod.{funcname}() arguments')
-            extra_args.remove('--test')
-        if '--format' in extra_args:
-            mlog.warning(f'Do not add --format to rustmod.{funcname}() arguments')
-            i = extra_args.index('--format')
-            # Also delete the argument to --format
-            del extra_args[i + 1]
-            del extra_args[i]
-        for i, a in enumerate(extra_args):
-            if isinstance(a, str) and a.startswith('--format='):
-                del extra_args[i]
-                break
+        extra_args: T.List[_kwargs.TestArgs] = []
+        skip_next = False
+        for a in kwargs['args']:
+            if skip_next:
+                # Also delete the argument to --format
+                skip_next = False
+            elif a == '--test':
+                mlog.warning(f'Do not add --test to rustmod.{funcname}() arguments')
+            elif a == '--format':
+                mlog.warning(f'Do not add --format to rustmod.{funcname}() arguments')
+                skip_next = True
+            elif not (isinstance(a, str) and a.startswith('--format=')):
+                extra_args.append(a)
 
         # We need to cast here, as currently these don't have protocol in them, but test itself does.
         tkwargs = T.cast('_kwargs.FuncTest', kwargs.copy())
@@ -329,17 +331,27 @@ class RustModule(ExtensionModule):
         # TODO: if we want this to be per-machine we'll need a native kwarg
         clang_args = state.environment.properties.host.get_bindgen_clang_args().copy()
 
+        source_dir = state.environment.get_source_dir()
+        build_dir = state.environment.get_build_dir()
+        # clang only uses the first occurrence of an include directory, so
+        # leave out the repeats that overlapping include_directories give
+        seen_incdirs: T.Set[str] = set()
+
+        def add_include_dirs(incdirs: IncludeDirs) -> None:
+            for x in incdirs.to_string_list(source_dir, build_dir):
+                if x not in seen_incdirs:
+                    seen_incdirs.add(x)
+                    # bindgen always uses clang, so it's safe to hardcode -I here
+                    clang_args.append(f'-I{x}')
+
         for i in state.process_include_dirs(kwargs['include_directories']):
-            # bindgen always uses clang, so it's safe to hardcode -I here
-            clang_args.extend([f'-I{x}' for x in i.to_string_list(
-                state.environment.get_source_dir(), state.environment.get_build_dir())])
+            add_include_dirs(i)
         if are_asserts_disabled_for_subproject(state.subproject, state.environment):
             clang_args.append('-DNDEBUG')
 
         for de in kwargs['dependencies']:
             for i in de.get_include_dirs():
-                clang_args.extend([f'-I{x}' for x in i.to_string_list(
-                    state.environment.get_source_dir(), state.environment.get_build_dir())])
+                add_include_dirs(i)
             clang_args.extend(de.get_all_compile_args())
             for s in de.get_sources():
                 if isinstance(s, File):
@@ -426,12 +438,12 @@ class RustModule(ExtensionModule):
                 '--wrap-static-fns-path', os.path.join(state.environment.build_dir, '@OUTPUT1@')
             ]
 
-        cmd = self._bindgen_bin.get_command() + \
-            [
-                '@INPUT@', '--output',
-                os.path.join(state.environment.build_dir, '@OUTPUT0@')
-            ] + \
-            kwargs['args'] + inline_wrapper_args
+        cmd = [
+            *self._bindgen_bin.get_command(),
+            '@INPUT@', '--output',
+            os.path.join(state.environment.build_dir, '@OUTPUT0@'),
+            *kwargs['args'], *inline_wrapper_args,
+        ]
         if self._bindgen_rust_target and '--rust-target' not in cmd:
             cmd.extend(['--rust-target', self._bindgen_rust_target])
         if self._bindgen_set_std and '--rust-edition' not in cmd:
@@ -445,14 +457,14 @@ class RustModule(ExtensionModule):
         cmd.extend(['-MD', '-MQ', '@INPUT@', '-MF', '@DEPFILE@'])
 
         target = CustomTarget(
-            f'rustmod-bindgen-{name}'.replace('/', '_'),
+            f'rustmod-bindgen-{name}-{outputs[0]}'.translate(_BINDGEN_NAME_TRANS),
             state.subdir,
             state.subproject,
             state.environment,
             cmd,
             [header],
             outputs,
-            depfile='@PLAINNAME@.d',
+            depfile=f'{outputs[0]}.d',
             extra_depends=depends,
             depend_files=depend_files,
             backend=state.backend,
@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 import re
 import codecs
 import os
+import sys
 import typing as T
 
 from .mesonlib import MesonException
@@ -215,6 +216,10 @@ class Lexer:
                         if value in self.keywords:
                             tid = value
                         else:
+                            # Identifiers end up as function, method, variable
+                            # and keyword argument names, which are looked up
+                            # in dicts keyed by (interned) string literals.
+                            value = sys.intern(value)
                             if value in self.future_keywords:
                                 mlog.warning(f"Identifier '{value}' will become a reserved keyword in a future release. Please rename it.",
                                              location=BaseNode(lineno, col, filename))
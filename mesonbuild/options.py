@@ -109,6 +109,7 @@ _BUILTIN_NAMES = {
 
 _BAD_VALUE = 'Qwert Zuiopü'
 _optionkey_cache: T.Dict[_OptionKeyTuple, OptionKey] = {}
+_optionkey_string_cache: T.Dict[str, OptionKey] = {}
 
 
 class OptionKey:
@@ -247,6 +248,10 @@ class OptionKey:
         OptionKey out of them.
         """
         assert isinstance(raw, str)
+        try:
+            return _optionkey_string_cache[raw]
+        except KeyError:
+            pass
         try:
             subproject, raw2 = raw.split(':')
         except ValueError:
@@ -266,7 +271,9 @@ class OptionKey:
         assert ':' not in opt
         assert opt.count('.') < 2
 
-        return cls(opt, subproject, for_machine)
+        key = cls(opt, subproject, for_machine)
+        _optionkey_string_cache[raw] = key
+        return key
 
     def evolve(self,
                name: T.Optional[str] = None,
@@ -288,6 +295,8 @@ class OptionKey:
 
     def as_root(self) -> OptionKey:
         """Convenience method for key.evolve(subproject='')."""
+        if self.subproject == '':
+            return self
         return self.evolve(subproject='')
 
     def as_build(self) -> OptionKey:
@@ -912,6 +912,7 @@ def _version_extract_cmpop(vstr2: str) -> T.Tuple[T.Callable[[T.Any, T.Any], boo
     return (cmpop, vstr2)
 
 
+@lru_cache(maxsize=None)
 def version_compare(vstr1: str, vstr2: str) -> bool:
     (cmpop, vstr2) = _version_extract_cmpop(vstr2)
     return cmpop(Version(vstr1), Version(vstr2))
@@ -932,6 +933,7 @@ def version_compare_many(vstr1: str, conditions: T.Union[str, T.Iterable[str]])
 
 # determine if the minimum version satisfying the condition |condition| exceeds
 # the minimum version for a feature |minimum|
+@lru_cache(maxsize=None)
 def version_compare_condition_with_min(condition: str, minimum: str) -> bool:
     if condition.startswith('>='):
         cmpop = operator.le
@@ -2066,8 +2068,7 @@ class OrderedSet(T.MutableSet[_T]):
         return item
 
     def update(self, iterable: T.Iterable[_T]) -> None:
-        for item in iterable:
-            self.__container[item] = None
+        self.__container.update(dict.fromkeys(iterable))
 
     def difference(self, set_: T.Iterable[_T]) -> 'OrderedSet[_T]':
         return type(self)(e for e in self if e not in set_)
@@ -330,9 +330,17 @@ class Resolver:
             from .. import cargo
             for wrap in cargo.load_wraps(source_dir, self.subdir_root):
                 self.wraps[wrap.name] = wrap
-        # Load subprojects/*.wrap
-        if os.path.isdir(self.subdir_root):
-            root, dirs, files = next(os.walk(self.subdir_root))
+        # Load subprojects/*.wrap. A single scandir() pass both tells whether
+        # the directory exists and classifies its entries, without a stat()
+        # per entry on platforms that report the entry type.
+        try:
+            with os.scandir(self.subdir_root) as it:
+                entries = list(it)
+        except (FileNotFoundError, NotADirectoryError):
+            entries = None
+        if entries is not None:
+            dirs = [e.name for e in entries if e.is_dir()]
+            files = [e.name for e in entries if not e.is_dir()]
             for i in files:
                 if not i.endswith('.wrap'):
                     continue
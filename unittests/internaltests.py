@@ -32,7 +32,7 @@ from mesonbuild.compilers.cpp import VisualStudioCPPCompiler
 from mesonbuild.compilers.d import DmdDCompiler
 from mesonbuild.linkers import linkers
 from mesonbuild.interpreterbase import typed_pos_args, InvalidArguments, ObjectHolder
-from mesonbuild.interpreterbase import typed_pos_args, InvalidArguments, typed_kwargs, ContainerTypeInfo, KwargInfo
+from mesonbuild.interpreterbase import typed_pos_args, InvalidArguments, typed_kwargs, ContainerTypeInfo, KwargInfo, stringifyUserArguments
 from mesonbuild.mesonlib import (
     LibType, MachineChoice, PerMachine, Version, is_windows, is_osx,
     is_cygwin, is_openbsd, search_version, MesonException, python_command,
@@ -1710,6 +1710,7 @@ class InternalTests(unittest.TestCase):
         build = mock.Mock()
         build.environment = mock.Mock()
         build.environment.get_source_dir = mock.Mock(return_value='')
+        build.environment.get_build_dir = mock.Mock(return_value='')
         with mock.patch('mesonbuild.interpreter.Interpreter._redetect_machines', mock.Mock()), \
                 self.assertRaises(mesonbuild.mesonlib.MesonBugException):
             i = mesonbuild.interpreter.Interpreter(build)
@@ -1747,6 +1748,20 @@ class InternalTests(unittest.TestCase):
             with self.subTest(raw):
                 self.assertEqual(OptionKey.from_string(raw), expected)
 
+    def test_stringify_user_arguments(self) -> None:
+        stringify = stringifyUserArguments
+        # True and 1 hash equal, make sure the cached scalars keep them apart
+        self.assertEqual(stringify(1, ''), '1')
+        self.assertEqual(stringify(True, ''), 'true')
+        self.assertEqual(stringify(0, ''), '0')
+        self.assertEqual(stringify(False, ''), 'false')
+        self.assertEqual(stringify('foo', ''), 'foo')
+        self.assertEqual(stringify('foo', '', quote=True), "'foo'")
+        self.assertEqual(stringify(['a', 1, True], ''), "['a', 1, true]")
+        self.assertEqual(stringify({'a': [False, 0]}, ''), "{'a' : [false, 0]}")
+        with self.assertRaises(InvalidArguments):
+            stringify(1.5, '')
+
     def test_env2mfile_deb(self) -> None:
         MachineInfo = mesonbuild.scripts.env2mfile.MachineInfo
         to_machine_info = mesonbuild.scripts.env2mfile.dpkg_architecture_to_machine_info